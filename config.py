@@ -14,6 +14,7 @@ DISPLAY_TIMEZONE = "Australia/Sydney"  # Timezone for displaying play times (e.g
 # Server settings
 SERVER_HOST = "0.0.0.0"
 SERVER_PORT = 8080
+SERVER_USE_PROCESS = False  # Run the web server in a separate process (isolates it from the GIL)
 OUTPUT_DIR = "output"  # Directory where images and hash will be saved
 
 # File paths (relative to OUTPUT_DIR)
@@ -0,0 +1,65 @@
+"""Numba-accelerated Floyd-Steinberg dithering for e-paper color modes"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def fs_dither_2row(pixels, levels):
+    """
+    Floyd-Steinberg dither a grayscale image in-place, quantizing to
+    `levels` evenly spaced gray levels.
+
+    Processes two rows in tandem: while pixel (x, y) is being diffused,
+    pixel (x - 2, y + 1) already has all of its incoming error and is
+    handled in the same inner-loop iteration. Merging the passes halves
+    the memory traffic of this memory-bound raster scan, and folding the
+    quantization into the loop avoids a separate posterize pass.
+
+    Args:
+        pixels: 2D uint8 array (modified in-place to the quantized values)
+        levels: Number of output gray levels (2 for monochrome, 4 for 2-bit)
+    """
+    h, w = pixels.shape
+    step = 255 // (levels - 1)
+    err = np.zeros((h + 1, w + 2), np.int16)
+
+    for y in range(0, h, 2):
+        has_next = y + 1 < h
+        for x in range(w + 2):
+            # Upper row: pixel (x, y)
+            if x < w:
+                old = pixels[y, x] + err[y, x + 1]
+                if old < 0:
+                    old = 0
+                elif old > 255:
+                    old = 255
+                q = (old * levels) // 256 * step
+                pixels[y, x] = q
+                e = old - q
+                err[y, x + 2] += (e * 7) // 16
+                err[y + 1, x] += (e * 3) // 16
+                err[y + 1, x + 1] += (e * 5) // 16
+                err[y + 1, x + 2] += (e * 1) // 16
+            # Lower row: pixel (x - 2, y + 1), two columns behind so all
+            # of its error from the upper row has already arrived
+            if has_next and 2 <= x < w + 2:
+                x2 = x - 2
+                old = pixels[y + 1, x2] + err[y + 1, x2 + 1]
+                if old < 0:
+                    old = 0
+                elif old > 255:
+                    old = 255
+                q = (old * levels) // 256 * step
+                pixels[y + 1, x2] = q
+                e = old - q
+                err[y + 1, x2 + 2] += (e * 7) // 16
+                if y + 2 < h:
+                    err[y + 2, x2] += (e * 3) // 16
+                    err[y + 2, x2 + 1] += (e * 5) // 16
+                    err[y + 2, x2 + 2] += (e * 1) // 16
+
+
+# Warm up the JIT at import time so the first real image doesn't pay
+# the compilation latency
+fs_dither_2row(np.zeros((4, 4), dtype=np.uint8), 2)
@@ -2,14 +2,45 @@
 
 from PIL import Image, ImageDraw, ImageFont
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+import functools
 import logging
+import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# Numba-accelerated dithering (falls back to Pillow's dither if unavailable)
+try:
+    import numpy as np
+    from dither import fs_dither_2row
+    _has_fast_dither = True
+except ImportError:
+    _has_fast_dither = False
+
+# Cython fast paths for text layout (build with: python setup.py build_ext
+# --inplace); pure-Python implementations are used when not built
+try:
+    import image_generator_fast as _fast
+except ImportError:
+    _fast = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _measure(font: ImageFont.ImageFont, word: str) -> float:
+    """
+    Measure the pixel width of a word for a given font (cached)
+
+    Repeated words across polls (artist/album names) hit the cache
+    instead of going back through FreeType.
+    """
+    return font.getlength(word)
+
+
 class ImageGenerator:
     """Generates images displaying current song information"""
 
@@ -48,6 +79,75 @@ class ImageGenerator:
         self.text_margin = text_margin
         self.line_spacing = line_spacing
 
+        # Compose monochrome/grayscale output directly in single-channel
+        # 'L' mode so every draw/paste moves a third of the bytes an RGB
+        # intermediate would; 7color still needs RGB for quantization
+        if color_mode in ('monochrome', 'grayscale'):
+            self._base_mode = 'L'
+            self._fg = 0
+            self._bg = 255
+        else:
+            self._base_mode = 'RGB'
+            self._fg = 'black'
+            self._bg = 'white'
+
+        # Cache of processed (fetched + resized) artwork keyed by URL.
+        # Most polls return the same song, so this skips the HTTP fetch,
+        # JPEG decode, and LANCZOS resize on unchanged-song polls.
+        self._artwork_cache = {}
+        self._artwork_cache_size = 8
+
+        # Placeholder artwork, built lazily on first use
+        self._placeholder = None
+
+        # Persistent HTTP session so repeat fetches to the artwork CDN
+        # reuse the pooled connection instead of a fresh TCP + TLS setup
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # ETag revalidation cache: url -> (etag, decoded image). Bounded
+        # like the artwork cache — each entry holds a full decoded image,
+        # and a long-running daemon sees a new URL per song
+        self._etag_cache = {}
+        self._etag_cache_size = 8
+
+        # Single worker for the artwork fetch so the network wait can
+        # overlap with text layout in generate_image
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Fixed palette for 7-color e-paper displays (black, white, red,
+        # green, blue, yellow, orange), built once so quantization never
+        # has to derive an adaptive palette per frame
+        self._epd_palette_im = Image.new('P', (1, 1))
+        epd_colors = [
+            0, 0, 0,        # black
+            255, 255, 255,  # white
+            255, 0, 0,      # red
+            0, 255, 0,      # green
+            0, 0, 255,      # blue
+            255, 255, 0,    # yellow
+            255, 128, 0,    # orange
+        ]
+        self._epd_palette_im.putpalette(epd_colors + [0] * (256 * 3 - len(epd_colors)))
+
+        # 256-entry LUT mapping 8-bit gray to 4 levels (0, 85, 170, 255);
+        # passing the bytes table to Image.point keeps the transform
+        # entirely in C instead of calling a Python lambda per entry
+        self._gray4_lut = bytes((i // 64) * 85 for i in range(256))
+
+        # Memo of the last successful render: identical inputs (e.g. the
+        # same song re-announced, or a rerender after restart) skip PIL
+        # entirely and just rewrite the cached bytes
+        self._last_key = None
+        self._last_bytes: Optional[bytes] = None
+        self._last_raw: Optional[bytes] = None
+
         # Load fonts
         try:
             if font_path:
@@ -65,6 +165,26 @@ class ImageGenerator:
             self.font_artist = ImageFont.load_default()
             self.font_album = ImageFont.load_default()
 
+        # Line heights are constant per font (ascent + descent), so
+        # compute them once instead of calling getbbox on every drawn line
+        self._line_h_title = sum(self.font_title.getmetrics()) + self.line_spacing
+        self._line_h_artist = sum(self.font_artist.getmetrics()) + self.line_spacing
+        self._line_h_album = sum(self.font_album.getmetrics()) + self.line_spacing
+
+        # Pre-rendered "DoubleJ" banner: the station label never changes,
+        # so render it once and only draw the play time per image
+        self._doublej_prefix = 'DoubleJ   '
+        self._doublej_w = self.font_album.getlength(self._doublej_prefix)
+        self._doublej_stamp = Image.new(
+            self._base_mode, (self.width - self.artwork_size, 18), color=self._fg
+        )
+        ImageDraw.Draw(self._doublej_stamp).text(
+            (self.text_margin, 2),
+            self._doublej_prefix,
+            fill=self._bg,
+            font=self.font_album,
+        )
+
     def _fetch_artwork(self, url: Optional[str]) -> Optional[Image.Image]:
         """
         Fetch artwork from URL
@@ -80,34 +200,103 @@ class ImageGenerator:
             return None
 
         try:
-            response = requests.get(url, timeout=10)
+            headers = {}
+            cached = self._etag_cache.get(url)
+            if cached:
+                headers['If-None-Match'] = cached[0]
+
+            response = self._session.get(url, timeout=(3, 10), headers=headers)
+
+            if response.status_code == 304 and cached:
+                logger.debug(f"Artwork not modified (ETag match): {url}")
+                return cached[1]
+
             response.raise_for_status()
             img = Image.open(BytesIO(response.content))
+
+            etag = response.headers.get('ETag')
+            if etag:
+                # Evict the oldest entry if the cache is full
+                if url not in self._etag_cache and len(self._etag_cache) >= self._etag_cache_size:
+                    self._etag_cache.pop(next(iter(self._etag_cache)))
+                self._etag_cache[url] = (etag, img)
+
             return img
         except Exception as e:
             logger.error(f"Error fetching artwork: {e}")
             return None
 
+    def _get_processed_artwork(self, url: Optional[str]) -> Optional[Image.Image]:
+        """
+        Fetch and resize artwork, caching the result by URL
+
+        Args:
+            url: URL to artwork image
+
+        Returns:
+            Resized PIL Image ready to paste, or None if fetch fails
+        """
+        if not url:
+            return None
+
+        key = (url, self.artwork_size)
+        cached = self._artwork_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Using cached artwork for {url}")
+            return cached
+
+        artwork = self._fetch_artwork(url)
+        if artwork is None:
+            # Don't cache failures so transient errors can be retried
+            return None
+
+        # For much larger sources, do a cheap integer box-filter reduce
+        # to within 2x of the target first; LANCZOS cost scales with
+        # source area, so this keeps the expensive filter small
+        factor = min(
+            artwork.width // (self.artwork_size * 2),
+            artwork.height // (self.artwork_size * 2),
+        )
+        if factor >= 2:
+            artwork = artwork.reduce(factor)
+
+        artwork = artwork.resize((self.artwork_size, self.artwork_size), Image.LANCZOS)
+        if artwork.mode != self._base_mode:
+            artwork = artwork.convert(self._base_mode)
+
+        # Evict the oldest entry if the cache is full
+        if len(self._artwork_cache) >= self._artwork_cache_size:
+            self._artwork_cache.pop(next(iter(self._artwork_cache)))
+        self._artwork_cache[key] = artwork
+
+        return artwork
+
     def _create_placeholder_artwork(self) -> Image.Image:
         """
         Create a placeholder image when artwork is not available
 
+        The placeholder only depends on artwork_size and the title font,
+        so it is rendered once and a copy is returned on later calls.
+
         Returns:
             PIL Image object with placeholder
         """
-        img = Image.new('RGB', (self.artwork_size, self.artwork_size), color='gray')
-        draw = ImageDraw.Draw(img)
-
-        # Draw a simple music note symbol
-        draw.text(
-            (self.artwork_size // 2, self.artwork_size // 2),
-            "♪",
-            fill='white',
-            anchor='mm',
-            font=self.font_title
-        )
+        if self._placeholder is None:
+            img = Image.new(self._base_mode, (self.artwork_size, self.artwork_size), color='gray')
+            draw = ImageDraw.Draw(img)
 
-        return img
+            # Draw a simple music note symbol
+            draw.text(
+                (self.artwork_size // 2, self.artwork_size // 2),
+                "♪",
+                fill='white',
+                anchor='mm',
+                font=self.font_title
+            )
+
+            self._placeholder = img
+
+        return self._placeholder.copy()
 
     def _wrap_text(self, text: str, font: ImageFont.ImageFont, max_width: int) -> list:
         """
@@ -121,30 +310,77 @@ class ImageGenerator:
         Returns:
             List of text lines
         """
+        if _fast is not None:
+            return _fast.wrap_text(font, text, max_width)
+
         words = text.split()
         lines = []
         current_line = []
 
+        # Measure each word once and accumulate, instead of re-measuring
+        # the whole candidate line for every word
+        space_w = _measure(font, ' ')
+        current_width = 0.0
+
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            bbox = font.getbbox(test_line)
-            width = bbox[2] - bbox[0]
+            word_w = _measure(font, word)
+            test_width = current_width + (space_w if current_line else 0) + word_w
 
-            if width <= max_width:
+            if test_width <= max_width:
                 current_line.append(word)
+                current_width = test_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                     current_line = [word]
+                    current_width = word_w
                 else:
                     # Single word is too long, add it anyway
                     lines.append(word)
+                    current_width = 0.0
 
         if current_line:
             lines.append(' '.join(current_line))
 
         return lines if lines else [text]
 
+    def _draw_lines(
+        self,
+        draw: ImageDraw.ImageDraw,
+        lines: list,
+        x: int,
+        y: int,
+        line_h: int,
+        font: ImageFont.ImageFont,
+        max_y: int = 0,
+    ) -> int:
+        """
+        Draw text lines starting at (x, y), advancing y by line_h each
+
+        Args:
+            draw: ImageDraw to draw with
+            lines: Text lines to draw
+            x: Left edge of the text
+            y: Top of the first line
+            line_h: Vertical advance per line
+            font: Font to draw with
+            max_y: Stop before a line that would start within 20px of
+                this (0 for no limit)
+
+        Returns:
+            The y position after the last drawn line
+        """
+        if _fast is not None:
+            return _fast.draw_lines(draw, lines, x, y, line_h, max_y, self._fg, font)
+
+        for line in lines:
+            if max_y > 0 and y + 20 > max_y:
+                break
+            draw.text((x, y), line, fill=self._fg, font=font)
+            y += line_h
+
+        return y
+
     def _apply_color_mode(self, img: Image.Image) -> Image.Image:
         """
         Apply color mode conversion to the image
@@ -156,28 +392,58 @@ class ImageGenerator:
             Converted PIL Image
         """
         if self.color_mode == "monochrome":
-            # Convert to grayscale first, then to 1-bit (black and white)
-            img = img.convert('L')
-            img = img.convert('1', dither=Image.FLOYDSTEINBERG)
+            # Dither down to 1-bit (black and white)
+            if img.mode != 'L':
+                img = img.convert('L')
+            if _has_fast_dither:
+                pixels = np.array(img, dtype=np.uint8)
+                fs_dither_2row(pixels, 2)
+                # Pixels are already 0/255, so this is a plain threshold
+                img = Image.fromarray(pixels).convert('1')
+            else:
+                img = img.convert('1', dither=Image.FLOYDSTEINBERG)
         elif self.color_mode == "grayscale":
-            # Convert to 4-level grayscale (2-bit)
-            img = img.convert('L')
-            # Reduce to 4 levels
-            img = img.point(lambda x: (x // 64) * 85)  # Maps to 0, 85, 170, 255
-            img = img.convert('L', dither=Image.FLOYDSTEINBERG)
+            # Reduce to 4-level grayscale (2-bit)
+            if img.mode != 'L':
+                img = img.convert('L')
+            if _has_fast_dither:
+                # Dither and quantize to 4 levels in a single fused pass
+                pixels = np.array(img, dtype=np.uint8)
+                fs_dither_2row(pixels, 4)
+                img = Image.fromarray(pixels)
+            else:
+                # Reduce to 4 levels via the precomputed LUT
+                img = img.point(self._gray4_lut)
         elif self.color_mode == "7color":
-            # Convert to palette mode with 7 colors + white (8 colors total)
-            # This uses adaptive palette and dithering
-            img = img.convert('P', palette=Image.ADAPTIVE, colors=7, dither=Image.FLOYDSTEINBERG)
+            # Quantize against the fixed e-paper palette; the target
+            # display's colors never change, so there is no need to run
+            # adaptive palette generation on every frame
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img = img.quantize(palette=self._epd_palette_im, dither=Image.FLOYDSTEINBERG)
 
         return img
 
+    @staticmethod
+    def _write_atomic(output_path: str, data: bytes) -> None:
+        """
+        Write bytes to a temp file and atomically swap it into place
+
+        Args:
+            output_path: Final path for the file
+            data: Bytes to write
+        """
+        tmp_path = output_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+
     def _format_play_time(self, play_time: Any) -> str:
         """
         Format the play time for display
 
         Args:
-            play_time: Play time (could be datetime, string, or None)
+            play_time: Play time (datetime or None)
 
         Returns:
             Formatted time string
@@ -186,21 +452,10 @@ class ImageGenerator:
             return ''
 
         try:
-            # If it's already a datetime object
+            # RadioClient guarantees a datetime here; anything else is a
+            # caller passing raw data through, so just stringify it
             if isinstance(play_time, datetime):
                 return play_time.strftime('%I:%M %p')
-
-            # If it's a string, try to parse it
-            if isinstance(play_time, str):
-                # Try ISO format first
-                try:
-                    dt = datetime.fromisoformat(play_time.replace('Z', '+00:00'))
-                    return dt.strftime('%I:%M %p')
-                except:
-                    # If parsing fails, return as-is
-                    return play_time
-
-            # For other types, convert to string
             return str(play_time)
 
         except Exception as e:
@@ -219,19 +474,34 @@ class ImageGenerator:
             True if successful, False otherwise
         """
         try:
-            # Create base image (white background)
-            img = Image.new('RGB', (self.width, self.height), color='white')
-
-            # Fetch and process artwork
-            artwork = self._fetch_artwork(song_info.get('artwork_url'))
-            if artwork is None:
-                artwork = self._create_placeholder_artwork()
+            play_time_str = self._format_play_time(song_info.get('play_time'))
 
-            # Resize artwork to fit
-            artwork = artwork.resize((self.artwork_size, self.artwork_size), Image.LANCZOS)
+            # If every input that affects the rendered pixels matches the
+            # previous successful render, just rewrite the cached bytes
+            render_key = (
+                song_info.get('title'),
+                song_info.get('artist'),
+                song_info.get('album'),
+                song_info.get('artwork_url'),
+                play_time_str,
+                self.color_mode,
+            )
+            if render_key == self._last_key and self._last_bytes is not None:
+                logger.debug("Render inputs unchanged, reusing cached image bytes")
+                self._write_atomic(output_path, self._last_bytes)
+                if self._last_raw is not None:
+                    raw_output_path = output_path.rsplit('.', 1)[0] + '.raw'
+                    self._write_atomic(raw_output_path, self._last_raw)
+                return True
+
+            # Kick off the artwork fetch in the background so the network
+            # wait overlaps with the text layout below
+            artwork_future = self._io_pool.submit(
+                self._get_processed_artwork, song_info.get('artwork_url')
+            )
 
-            # Paste artwork on the left side
-            img.paste(artwork, (0, 0))
+            # Create base image (white background)
+            img = Image.new(self._base_mode, (self.width, self.height), color=self._bg)
 
             # Draw text on the right side
             draw = ImageDraw.Draw(img)
@@ -242,30 +512,19 @@ class ImageGenerator:
             current_y = self.text_margin
 
             # Draw play time with "DoubleJ" prefix at the top (if available)
-            play_time_str = self._format_play_time(song_info.get('play_time'))
             if play_time_str:
-                # Add "DoubleJ" prefix
-                time_text = f"DoubleJ   {play_time_str}"
-
-                # # Get text dimensions
-                bbox = self.font_album.getbbox(time_text)
-                text_height = bbox[3] - bbox[1]
-                text_width_actual = bbox[2] - bbox[0]
-
-                # # Add padding around the text
+                text_height = self._line_h_album - self.line_spacing
                 padding = 3
 
-                # # Draw black background rectangle
-                # bg_x1 = text_x - padding
-                # bg_y1 = current_y - padding
-                # bg_x2 = text_x + text_width_actual + padding
-                # bg_y2 = current_y + text_height + padding
-                # draw.rectangle([bg_x1, bg_y1, bg_x2, bg_y2], fill='black')
-                draw.rectangle([self.artwork_size, 0, self.width, 18], fill='black')
-                # current_y
-
-                # Draw white text on black background
-                draw.text((text_x, 2), time_text, fill='white', font=self.font_album)
+                # Blit the pre-rendered banner (black background plus the
+                # "DoubleJ" prefix), then draw just the time after it
+                img.paste(self._doublej_stamp, (self.artwork_size, 0))
+                draw.text(
+                    (text_x + self._doublej_w, 2),
+                    play_time_str,
+                    fill=self._bg,
+                    font=self.font_album,
+                )
 
                 # Update y position
                 current_y += text_height + padding * 2 + self.line_spacing
@@ -276,10 +535,9 @@ class ImageGenerator:
                 self.font_title,
                 text_width
             )
-            for line in title_lines:
-                draw.text((text_x, current_y), line, fill='black', font=self.font_title)
-                bbox = self.font_title.getbbox(line)
-                current_y += (bbox[3] - bbox[1]) + self.line_spacing
+            current_y = self._draw_lines(
+                draw, title_lines, text_x, current_y, self._line_h_title, self.font_title
+            )
 
             current_y += self.line_spacing  # Extra space after title
 
@@ -289,10 +547,9 @@ class ImageGenerator:
                 self.font_artist,
                 text_width
             )
-            for line in artist_lines:
-                draw.text((text_x, current_y), line, fill='black', font=self.font_artist)
-                bbox = self.font_artist.getbbox(line)
-                current_y += (bbox[3] - bbox[1]) + self.line_spacing
+            current_y = self._draw_lines(
+                draw, artist_lines, text_x, current_y, self._line_h_artist, self.font_artist
+            )
 
             current_y += self.line_spacing  # Extra space after artist
 
@@ -302,28 +559,42 @@ class ImageGenerator:
                 self.font_album,
                 text_width
             )
-            for line in album_lines:
-                # Check if we're running out of space
-                if current_y + 20 > self.height:
-                    break
-                draw.text((text_x, current_y), line, fill='black', font=self.font_album)
-                bbox = self.font_album.getbbox(line)
-                current_y += (bbox[3] - bbox[1]) + self.line_spacing
+            current_y = self._draw_lines(
+                draw, album_lines, text_x, current_y, self._line_h_album,
+                self.font_album, max_y=self.height
+            )
+
+            # Collect the artwork (text layout ran while it was in flight)
+            # and paste it on the left side
+            artwork = artwork_future.result()
+            if artwork is None:
+                artwork = self._create_placeholder_artwork()
+            img.paste(artwork, (0, 0))
 
             # Apply color mode conversion
             img = self._apply_color_mode(img)
 
-            # Save the PNG image
-            img.save(output_path)
+            # Encode the PNG to memory, then swap it into place atomically
+            # so the web server never observes a half-written file. The
+            # output is tiny and re-encoded every song change, so favour
+            # encode speed over compression ratio
+            buf = BytesIO()
+            img.save(buf, format='PNG', optimize=False, compress_level=1)
+            png_data = buf.getvalue()
+            self._write_atomic(output_path, png_data)
             logger.info(f"Image saved to {output_path}")
 
             # Save raw format (raw pixel data)
             raw_output_path = output_path.rsplit('.', 1)[0] + '.raw'
             raw_data = img.tobytes()
-            with open(raw_output_path, 'wb') as f:
-                f.write(raw_data)
+            self._write_atomic(raw_output_path, raw_data)
             logger.info(f"Raw image data saved to {raw_output_path}")
 
+            # Remember this render so identical inputs can skip PIL
+            self._last_bytes = png_data
+            self._last_raw = raw_data
+            self._last_key = render_key
+
             return True
 
         except Exception as e:
@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False
+"""Cython fast paths for the hot text layout loops in image_generator.
+
+Optional: image_generator falls back to the pure-Python implementations
+when this extension hasn't been built (see setup.py).
+"""
+
+
+cpdef list wrap_text(object font, str text, double max_width):
+    """
+    Wrap text to fit within max_width pixels for the given font.
+
+    Mirrors ImageGenerator._wrap_text but keeps the accumulation loop at
+    C level; only the per-word getlength call crosses into Pillow.
+    """
+    cdef list words = text.split()
+    cdef list lines = []
+    cdef list current_line = []
+    cdef double space_w = font.getlength(' ')
+    cdef double current_width = 0.0
+    cdef double word_w, test_width
+    cdef str word
+
+    for word in words:
+        word_w = font.getlength(word)
+        test_width = current_width + word_w
+        if current_line:
+            test_width += space_w
+
+        if test_width <= max_width:
+            current_line.append(word)
+            current_width = test_width
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_w
+            else:
+                # Single word is too long, add it anyway
+                lines.append(word)
+                current_width = 0.0
+
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines if lines else [text]
+
+
+cpdef int draw_lines(object draw, list lines, int x, int y, int line_h,
+                     int max_y, object fill, object font):
+    """
+    Draw each line at (x, y), advancing y by line_h per line.
+
+    Stops early when max_y is positive and the next line would start
+    within 20px of it. Returns the y position after the last line.
+    """
+    cdef str line
+    for line in lines:
+        if max_y > 0 and y + 20 > max_y:
+            break
+        draw.text((x, y), line, fill=fill, font=font)
+        y += line_h
+    return y
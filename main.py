@@ -1,10 +1,9 @@
 """Main application for Current Song Image Generator"""
 
-import os
 import time
 import logging
 import signal
-import sys
+import threading
 from pathlib import Path
 
 import config
@@ -15,7 +14,7 @@ from web_server import WebServer
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
@@ -57,7 +56,8 @@ class CurrentSongApp:
         self.web_server = WebServer(
             host=config.SERVER_HOST,
             port=config.SERVER_PORT,
-            directory=str(self.output_dir)
+            directory=str(self.output_dir),
+            use_process=getattr(config, 'SERVER_USE_PROCESS', False)
         )
 
         # File paths
@@ -67,6 +67,9 @@ class CurrentSongApp:
         # Running flag
         self.running = False
 
+        # Set to wake the poll loop and stop it immediately on shutdown
+        self._stop = threading.Event()
+
     def update_song(self) -> bool:
         """
         Fetch current song and update image if changed
@@ -134,38 +137,47 @@ class CurrentSongApp:
         # Main loop
         self.running = True
         try:
-            while self.running:
-                time.sleep(config.POLL_INTERVAL)
-                if self.running:  # Check again in case we stopped during sleep
-                    self.update_song()
+            while not self._stop.is_set():
+                # Wakes immediately when shutdown sets the event instead
+                # of sleeping out the remainder of the poll interval
+                self._stop.wait(config.POLL_INTERVAL)
+                if self._stop.is_set():
+                    break
+                self.update_song()
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         finally:
             self.shutdown()
 
+    def stop(self):
+        """Request the main loop to stop"""
+        self._stop.set()
+
     def shutdown(self):
         """Shutdown the application"""
         logger.info("Shutting down...")
         self.running = False
+        self._stop.set()
         self.web_server.stop()
         logger.info("Shutdown complete")
 
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals"""
-    logger.info(f"Received signal {signum}")
-    sys.exit(0)
-
-
 def main():
     """Main entry point"""
+    # Create the application
+    app = CurrentSongApp()
+
+    def signal_handler(signum, frame):
+        """Handle shutdown signals by waking the poll loop"""
+        logger.info(f"Received signal {signum}")
+        app.stop()
+
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Create and run application
-    app = CurrentSongApp()
+    # Run the application
     app.run()
 
 
@@ -44,6 +44,19 @@ class RadioClient:
         self.display_timezone = display_timezone
         self.client = ABCRadio()
 
+        # Build the timezone objects once rather than per conversion
+        if ZoneInfo is not None:
+            try:
+                self._utc_tz = ZoneInfo('UTC')
+                self._display_tz = ZoneInfo(display_timezone)
+            except Exception as e:
+                logger.warning(f"Error loading timezone '{display_timezone}': {e}")
+                self._utc_tz = None
+                self._display_tz = None
+        else:
+            self._utc_tz = None
+            self._display_tz = None
+
     def _convert_timezone(self, dt: Any) -> Any:
         """
         Convert datetime to configured timezone
@@ -54,14 +67,14 @@ class RadioClient:
         Returns:
             Datetime converted to display timezone, or original value if conversion fails
         """
-        if ZoneInfo is None:
-            logger.warning("ZoneInfo not available, returning datetime as-is")
+        if self._display_tz is None:
+            logger.warning("Timezone data not available, returning datetime as-is")
             return dt
 
         try:
-            # Create timezone objects once to avoid repeated lookups
-            utc_tz = ZoneInfo('UTC')
-            display_tz = ZoneInfo(self.display_timezone)
+            # Timezone objects were built once in __init__
+            utc_tz = self._utc_tz
+            display_tz = self._display_tz
 
             # If it's already a datetime object
             if isinstance(dt, datetime):
@@ -84,7 +97,7 @@ class RadioClient:
                     return parsed_dt.astimezone(display_tz)
                 except Exception as parse_error:
                     # If parsing fails, return as-is
-                    logger.debug(f"Could not parse datetime string: {parse_error}")
+                    logger.debug("Could not parse datetime string: %s", parse_error)
                     return dt
 
             # For other types, return as-is
@@ -92,9 +105,9 @@ class RadioClient:
 
         except Exception as e:
             logger.warning(f"Error converting timezone: {e}")
-            logger.debug(f"Input type: {type(dt)}, value: {dt}")
-            logger.debug(f"Display timezone: {self.display_timezone}")
-            logger.debug(f"tzdata available: {_has_tzdata}")
+            logger.debug("Input type: %s, value: %s", type(dt), dt)
+            logger.debug("Display timezone: %s", self.display_timezone)
+            logger.debug("tzdata available: %s", _has_tzdata)
             return dt
 
     def get_current_song(self) -> Optional[Dict[str, Any]]:
@@ -107,65 +120,63 @@ class RadioClient:
             - artist: Artist name
             - album: Album name
             - artwork_url: URL to artwork image
-            - play_time: Time the song started playing (datetime or string)
+            - play_time: Time the song started playing (datetime in the
+              display timezone, or None)
             Returns None if no song data is available
         """
         try:
             # Use the search method with limit=1 to get the most recent song
             search_result = self.client.search(station=self.station, limit=1)
 
-            if not search_result or not hasattr(search_result, 'radio_songs'):
+            radio_songs = getattr(search_result, 'radio_songs', None) if search_result else None
+            if radio_songs is None:
                 logger.warning(f"No results returned for station {self.station}")
                 return None
 
-            # Get the first (most recent) radio play
-            radio_songs = list(search_result.radio_songs)
-            if not radio_songs:
+            # Get the first (most recent) radio play without materializing
+            # the rest of the result set
+            radio_play = next(iter(radio_songs), None)
+            if radio_play is None:
                 logger.warning(f"No radio songs found for station {self.station}")
                 return None
 
-            radio_play = radio_songs[0]
-            logger.debug(radio_play)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("radio_play=%r", radio_play)
 
             # Extract song information
-            song = radio_play.song if hasattr(radio_play, 'song') else None
+            song = getattr(radio_play, 'song', None)
             if not song:
                 logger.warning("No song data in radio play")
                 return None
 
             # Extract play time - try different possible attribute names
-            play_time = None
-            for time_attr in ['played_time', 'play_time', 'time', 'service_played_time']:
-                if hasattr(radio_play, time_attr):
-                    play_time_raw = getattr(radio_play, time_attr)
-                    # Convert to target timezone if it's a datetime object
-                    if play_time_raw:
-                        play_time = self._convert_timezone(play_time_raw)
-                    break
+            play_time_raw = next(
+                (v for attr in ('played_time', 'play_time', 'time', 'service_played_time')
+                 if (v := getattr(radio_play, attr, None)) is not None),
+                None
+            )
+            # Convert to target timezone if a value was found; anything
+            # that can't be parsed into a datetime is dropped so that
+            # downstream consumers only ever see datetime or None
+            play_time = self._convert_timezone(play_time_raw) if play_time_raw else None
+            if not isinstance(play_time, datetime):
+                play_time = None
 
             # Extract title
-            title = song.title if hasattr(song, 'title') else ''
+            title = getattr(song, 'title', '')
 
             # Extract artist (first artist if multiple)
-            artist_name = ''
-            if hasattr(song, 'artists') and song.artists:
-                artists_list = list(song.artists)
-                if artists_list:
-                    first_artist = artists_list[0]
-                    if hasattr(first_artist, 'name'):
-                        artist_name = first_artist.name
+            artists = getattr(song, 'artists', None)
+            first_artist = next(iter(artists), None) if artists else None
+            artist_name = getattr(first_artist, 'name', '') if first_artist else ''
 
             # Extract album/release
-            album_title = ''
-            album = None
-            if hasattr(song, 'album') and song.album:
-                album = song.album
-                if hasattr(album, 'title'):
-                    album_title = album.title
+            album = getattr(song, 'album', None)
+            album_title = getattr(album, 'title', '') if album else ''
 
             # Extract artwork URL - find the best sized artwork
             artwork_url = None
-            if album and hasattr(album, 'artwork') and album.artwork:
+            if album and getattr(album, 'artwork', None):
                 # Check if artwork is iterable (list) or a single object
                 try:
                     # Try to convert to list (handles both iterable and single object)
@@ -175,28 +186,24 @@ class RadioClient:
                     artwork_list = [album.artwork]
 
                 if artwork_list:
-                    # Try to find artwork with specific height (closest to preferred)
-                    best_artwork = None
-                    best_diff = float('inf')
-
-                    for artwork in artwork_list:
-                        if hasattr(artwork, 'height') and hasattr(artwork, 'url'):
-                            height = artwork.height
-                            if isinstance(height, (int, float)):
-                                diff = abs(height - self.preferred_artwork_height)
-                                if diff < best_diff:
-                                    best_diff = diff
-                                    best_artwork = artwork
-                                    logger.debug(f"Found artwork: {height}px (diff: {diff})")
+                    # Find the artwork with height closest to preferred
+                    # in a single pass
+                    best_artwork = min(
+                        (a for a in artwork_list
+                         if getattr(a, 'url', None)
+                         and isinstance(getattr(a, 'height', None), (int, float))),
+                        key=lambda a: abs(a.height - self.preferred_artwork_height),
+                        default=None
+                    )
 
                     # If we found a good match, use it
-                    if best_artwork and hasattr(best_artwork, 'url'):
+                    if best_artwork:
                         artwork_url = best_artwork.url
-                        logger.debug(f"Selected artwork: {best_artwork.height}px - {artwork_url}")
+                        logger.debug("Selected artwork: %spx - %s", best_artwork.height, artwork_url)
                     # Otherwise, fall back to first artwork with URL
-                    elif artwork_list and hasattr(artwork_list[0], 'url'):
+                    elif artwork_list and getattr(artwork_list[0], 'url', None):
                         artwork_url = artwork_list[0].url
-                        logger.debug(f"Fallback to first artwork: {artwork_url}")
+                        logger.debug("Fallback to first artwork: %s", artwork_url)
 
             song_info = {
                 'title': title,
@@ -0,0 +1,21 @@
+"""Optional build for the Cython fast paths (image_generator_fast)
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+The application runs fine without it; image_generator falls back to the
+pure-Python implementations when the extension isn't present.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="current-song-img-generator-fast",
+    ext_modules=cythonize(
+        "image_generator_fast.pyx",
+        language_level=3,
+        compiler_directives={"boundscheck": False},
+    ),
+)
@@ -1,35 +1,186 @@
 """Simple HTTP server for hosting generated images"""
 
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import asyncio
+import multiprocessing
 import os
 import logging
 import threading
+import time
+
+# Optional single-thread event-loop backend: aiohttp serves all clients
+# from one loop (with sendfile for the static files), so there's no
+# per-request thread and no extra GIL contention with image generation
+try:
+    from aiohttp import web as aio_web
+    _has_aiohttp = True
+except ImportError:
+    _has_aiohttp = False
 
 logger = logging.getLogger(__name__)
 
+# Short-lived stat cache so the polling clients hammering the same
+# couple of files don't stat them on every request
+_STAT_TTL = 0.5  # seconds
+_stat_cache = {}  # path -> (expiry, stat result)
+
+
+def _cached_stat(path: str) -> os.stat_result:
+    """
+    os.stat with a small TTL cache
+
+    Args:
+        path: Filesystem path to stat
+
+    Returns:
+        The (possibly cached) stat result
+    """
+    now = time.monotonic()
+    entry = _stat_cache.get(path)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    st = os.stat(path)
+    _stat_cache[path] = (now + _STAT_TTL, st)
+    return st
+
+
+class ImageHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server tuned for serving the generated images"""
+
+    # Don't let open client connections block shutdown
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
 
 class ImageHTTPRequestHandler(SimpleHTTPRequestHandler):
     """Custom HTTP request handler that serves files from the output directory"""
 
-    def __init__(self, *args, directory=None, **kwargs):
+    # Keep connections alive so overlay/browser reloads reuse them
+    protocol_version = 'HTTP/1.1'
+
+    def __init__(self, *args, directory=None, path_map=None, **kwargs):
         """
         Initialize the request handler
 
         Args:
             directory: Directory to serve files from
+            path_map: Callable returning a {url path: filesystem path}
+                dict of known files, or None to always resolve normally
         """
         self.directory = directory
+        self.path_map = path_map
         super().__init__(*args, directory=directory, **kwargs)
 
     def log_message(self, format, *args):
         """Override to use our logger instead of stderr"""
         logger.info(f"{self.address_string()} - {format % args}")
 
+    def translate_path(self, path):
+        """Resolve known output files from the pre-built map"""
+        if self.path_map is not None:
+            # Strip query/fragment the same way the base resolver does
+            clean = path.split('?', 1)[0].split('#', 1)[0]
+            mapped = self.path_map().get(clean)
+            if mapped:
+                return mapped
+        return super().translate_path(path)
+
+    def send_head(self):
+        """
+        Add ETag revalidation on top of the default file serving
+
+        Repeat GETs from the polling overlay answer with a ~100-byte 304
+        instead of streaming the whole file again.
+        """
+        path = self.translate_path(self.path)
+        try:
+            if os.path.isdir(path):
+                return super().send_head()
+            st = _cached_stat(path)
+        except OSError:
+            return super().send_head()
+
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return None
+
+        # Attach the ETag to the headers the default path is about to send
+        self._pending_etag = etag
+        try:
+            return super().send_head()
+        finally:
+            self._pending_etag = None
+
+    def end_headers(self):
+        """Inject the pending ETag before the header block is closed"""
+        etag = getattr(self, '_pending_etag', None)
+        if etag:
+            self.send_header('ETag', etag)
+            # Force revalidation so clients always see the current song
+            self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """
+        Copy the file to the socket with zero-copy sendfile when possible
+
+        Falls back to the base implementation's userspace copy loop when
+        either end doesn't expose a file descriptor (e.g. wrapped
+        sockets or in-memory sources).
+        """
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            offset = 0
+            count = os.fstat(in_fd).st_size
+        except (AttributeError, OSError, ValueError):
+            super().copyfile(source, outputfile)
+            return
+
+        try:
+            while offset < count:
+                sent = os.sendfile(out_fd, in_fd, offset, count - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset == 0:
+                # Nothing sent yet, safe to retry with the regular copy
+                super().copyfile(source, outputfile)
+            else:
+                raise
+
+
+def _serve_in_process(host: str, port: int, directory: str):
+    """
+    Blocking server entry point for the process-isolated mode
+
+    Runs in a child process, so it serves from its own interpreter with
+    its own GIL; clients fetching images never contend with the image
+    generation pipeline in the parent.
+
+    Args:
+        host: Host address to bind to
+        port: Port to listen on
+        directory: Directory to serve files from
+    """
+    handler = partial(ImageHTTPRequestHandler, directory=directory)
+    server = ImageHTTPServer((host, port), handler)
+    logger.info(f"Server process started at http://{host}:{port}")
+    server.serve_forever()
+
 
 class WebServer:
     """HTTP server for hosting generated images"""
 
-    def __init__(self, host: str = "0.0.0.0", port: int = 8080, directory: str = "output"):
+    def __init__(self, host: str = "0.0.0.0", port: int = 8080, directory: str = "output",
+                 use_process: bool = False):
         """
         Initialize the web server
 
@@ -37,28 +188,119 @@ class WebServer:
             host: Host address to bind to
             port: Port to listen on
             directory: Directory to serve files from
+            use_process: Serve from a child process instead of a thread,
+                isolating request handling from the parent's GIL
         """
         self.host = host
         self.port = port
         self.directory = os.path.abspath(directory)
+        self.use_process = use_process
+        self.process = None
         self.server = None
         self.thread = None
 
+        # Event loop state when running on the aiohttp backend
+        self._aio_loop = None
+        self._aio_stop = None
+
         # Create directory if it doesn't exist
         os.makedirs(self.directory, exist_ok=True)
 
+        # Resolved {url path: filesystem path} map for the handful of
+        # files we serve, refreshed on a TTL
+        self._path_map = {}
+        self._path_map_expiry = 0.0
+
+    def _get_path_map(self):
+        """
+        Return the url-to-filesystem map of served files
+
+        Rebuilt from a directory listing when the TTL lapses so files
+        created after startup still appear.
+
+        Returns:
+            Dict mapping url paths to absolute filesystem paths
+        """
+        now = time.monotonic()
+        if now >= self._path_map_expiry:
+            try:
+                self._path_map = {
+                    '/' + name: os.path.join(self.directory, name)
+                    for name in os.listdir(self.directory)
+                }
+            except OSError as e:
+                logger.warning(f"Error listing {self.directory}: {e}")
+                self._path_map = {}
+            self._path_map_expiry = now + 5.0
+        return self._path_map
+
+    def _run_aiohttp(self):
+        """Serve the directory from a single-thread asyncio event loop"""
+        async def serve():
+            """Bring the site up and hold it until stop() fires"""
+            app = aio_web.Application()
+            # aiohttp's static handler uses sendfile and handles
+            # ETag/Last-Modified revalidation itself
+            app.router.add_static('/', self.directory, show_index=False)
+            runner = aio_web.AppRunner(app)
+            await runner.setup()
+            site = aio_web.TCPSite(runner, self.host, self.port)
+            await site.start()
+            logger.info(f"Server started at http://{self.host}:{self.port} (aiohttp)")
+            logger.info(f"Serving files from: {self.directory}")
+            try:
+                await self._aio_stop.wait()
+            finally:
+                await runner.cleanup()
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._aio_stop = asyncio.Event()
+        self._aio_loop = loop
+        try:
+            loop.run_until_complete(serve())
+        finally:
+            self._aio_loop = None
+            loop.close()
+
     def start(self):
         """Start the web server in a background thread"""
-        if self.thread and self.thread.is_alive():
+        if self.is_running():
             logger.warning("Server is already running")
             return
 
+        if self.use_process:
+            # The child serves the files straight off disk, which is
+            # already the handoff channel between generator and server,
+            # so no shared-memory plumbing is needed — just a process
+            # whose request handling can't touch the parent's GIL
+            self.process = multiprocessing.Process(
+                target=_serve_in_process,
+                args=(self.host, self.port, self.directory),
+                daemon=True,
+            )
+            self.process.start()
+            logger.info("Server process started")
+            return
+
+        if _has_aiohttp:
+            # One event loop serves every client: no per-request thread
+            # stack and only a single thread competing for the GIL
+            self.thread = threading.Thread(target=self._run_aiohttp, daemon=True)
+            self.thread.start()
+            logger.info("Server thread started")
+            return
+
         def run_server():
             """Run the server"""
-            handler = lambda *args, **kwargs: ImageHTTPRequestHandler(
-                *args, directory=self.directory, **kwargs
+            # partial is C-implemented, so each accepted connection skips
+            # the extra Python frame a lambda factory would add
+            handler = partial(
+                ImageHTTPRequestHandler,
+                directory=self.directory,
+                path_map=self._get_path_map,
             )
-            self.server = HTTPServer((self.host, self.port), handler)
+            self.server = ImageHTTPServer((self.host, self.port), handler)
             logger.info(f"Server started at http://{self.host}:{self.port}")
             logger.info(f"Serving files from: {self.directory}")
             self.server.serve_forever()
@@ -69,6 +311,22 @@ class WebServer:
 
     def stop(self):
         """Stop the web server"""
+        if self.process is not None:
+            logger.info("Stopping server process...")
+            self.process.terminate()
+            self.process.join(timeout=5)
+            self.process = None
+            logger.info("Server stopped")
+            return
+
+        if self._aio_loop is not None:
+            logger.info("Stopping server...")
+            self._aio_loop.call_soon_threadsafe(self._aio_stop.set)
+            if self.thread:
+                self.thread.join(timeout=5)
+            logger.info("Server stopped")
+            return
+
         if self.server:
             logger.info("Stopping server...")
             self.server.shutdown()
@@ -83,4 +341,6 @@ class WebServer:
         Returns:
             True if server is running, False otherwise
         """
+        if self.process is not None:
+            return self.process.is_alive()
         return self.thread is not None and self.thread.is_alive()